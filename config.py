@@ -45,3 +45,6 @@ MAX_RESULTS_PER_QUERY = 20   # Per query, max 100
 # LLM API settings (NanoGPT — OpenAI-compatible)
 LLM_MODEL = "minimax/minimax-m2.5"  # Open source, ~$0.001/run
 MAX_TOKENS = 4096
+# gzip the request body (the posts JSON compresses well). Off until the
+# endpoint is confirmed to accept Content-Encoding: gzip on requests.
+LLM_GZIP_REQUESTS = False
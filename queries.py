@@ -5,6 +5,7 @@ Builds effective X API search queries from freeform topic strings.
 Uses quoted phrases, OR chaining, community handles, and negative filters.
 """
 
+import functools
 import re
 
 # ─── NOISE FILTERS ───────────────────────────────────────────────────────────
@@ -44,22 +45,51 @@ COMMUNITY_HANDLES = {
     "mlx": ["@ml_explore"],
 }
 
+# Lowercased (key, accounts) pairs, computed once for _find_community_handles
+COMMUNITY_KEYS_LOWER = [(k.lower(), tuple(v)) for k, v in COMMUNITY_HANDLES.items()]
+
+# One alternation over every key, longest first so "ponyxl" wins over "pony".
+# A leading boundary keeps "llama" from matching inside "ollama"; there's no
+# trailing one, so versioned spellings like "llama3" and "sdxl1.0" still match.
+_COMMUNITY_RE = re.compile(
+    r"(?<![a-z0-9])(" + "|".join(
+        re.escape(k) for k, _ in sorted(COMMUNITY_KEYS_LOWER, key=lambda kv: -len(kv[0]))
+    ) + r")",
+    re.IGNORECASE,
+)
+_KEY_TO_ACCOUNTS = dict(COMMUNITY_KEYS_LOWER)
+
+# ─── SIGNAL WORDS ────────────────────────────────────────────────────────────
+# Terms that mark a post as news rather than chatter, OR'd into query 2
+SIGNAL_WORDS = ["release", "new", "benchmark", "comparison", "update", "workflow", "tutorial", "guide"]
+
+SIGNAL_WORDS_STR = " OR ".join(f'"{w}"' for w in SIGNAL_WORDS)
+
+# Fixed tails of the generated queries, specialized once at import
+_FILTER_SUFFIX = f") {NEGATIVE_FILTER_STR}"
+_SIGNAL_FILTER_SUFFIX = f") ({SIGNAL_WORDS_STR}) {NEGATIVE_FILTER_STR}"
+
 # ─── FILLER WORDS ────────────────────────────────────────────────────────────
-FILLER = {
+FILLER = frozenset({
     "and", "the", "for", "with", "including", "models", "model",
     "such", "like", "also", "about", "from", "that", "this",
     "into", "using", "based", "their", "other", "these",
     "image", "generation",  # too generic on their own
-}
+})
+
+# Word tokens within a comma-separated chunk
+_TOK_RE = re.compile(r"[^\s,]+")
 
 
-def _extract_phrases_and_keywords(topic: str) -> tuple[list[str], list[str]]:
+@functools.lru_cache(maxsize=128)
+def _extract_phrases_and_keywords(topic: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
     """Parse a topic string into multi-word phrases and single keywords.
 
     Splits on commas first to get phrase-level chunks, then identifies
     which chunks are multi-word (quoted as phrases) vs single keywords.
 
     Returns (phrases, keywords) — phrases are multi-word, keywords are single-word.
+    Cached per topic; tuples so the cached value can't be mutated.
     """
     phrases = []
     keywords = []
@@ -68,12 +98,12 @@ def _extract_phrases_and_keywords(topic: str) -> tuple[list[str], list[str]]:
     chunks = [c.strip() for c in topic.split(",") if c.strip()]
 
     for chunk in chunks:
-        # Clean up each chunk
-        words = chunk.split()
+        # Clean up each chunk — lowercase each word once
+        words = [(w, w.lower()) for w in _TOK_RE.findall(chunk)]
         # Remove pure filler words from edges
-        cleaned = [w for w in words if w.lower() not in FILLER or len(words) <= 2]
+        cleaned = [w for w, lw in words if lw not in FILLER or len(words) <= 2]
         if not cleaned:
-            cleaned = words  # fallback: keep original if all were "filler"
+            cleaned = [w for w, _ in words]  # fallback: keep original if all were "filler"
 
         text = " ".join(cleaned)
 
@@ -89,20 +119,28 @@ def _extract_phrases_and_keywords(topic: str) -> tuple[list[str], list[str]]:
             if w.lower() not in FILLER:
                 keywords.append(w)
 
-    return phrases, keywords
+    return tuple(phrases), tuple(keywords)
 
 
-def _find_community_handles(phrases: list[str], keywords: list[str]) -> list[str]:
-    """Find relevant community handles based on topic terms."""
-    handles = set()
-    all_terms = [p.lower() for p in phrases] + [k.lower() for k in keywords]
+def _find_community_handles(phrases: tuple[str, ...], keywords: tuple[str, ...]) -> list[str]:
+    """Find relevant community handles based on topic terms.
 
-    for term in all_terms:
-        for key, accounts in COMMUNITY_HANDLES.items():
-            if key in term or term in key:
-                handles.update(accounts)
-
-    return sorted(handles)
+    Earlier terms' handles come first, so the ``[:6]`` slice keeps the most relevant.
+    """
+    handles: dict[str, None] = {}
+    for term in phrases + keywords:
+        term = term.lower()
+        if not term:
+            continue
+        # key in term
+        for key in _COMMUNITY_RE.findall(term):
+            handles.update(dict.fromkeys(_KEY_TO_ACCOUNTS[key.lower()]))
+        # term in key
+        for key, accounts in COMMUNITY_KEYS_LOWER:
+            if term in key:
+                handles.update(dict.fromkeys(accounts))
+
+    return list(handles)
 
 
 def build_topic_queries(topic: str) -> list[str]:
@@ -114,6 +152,15 @@ def build_topic_queries(topic: str) -> list[str]:
     3. Community query — from/mention known accounts for the topic
     4. Fallback — quoted full topic if nothing else worked
     """
+    return list(_build_topic_queries(topic))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_topic_queries(topic: str) -> tuple[str, ...]:
+    """Cached body of build_topic_queries — pure in ``topic``, so safe to memoize.
+
+    Returns a tuple so cached results can't be mutated by callers.
+    """
     phrases, keywords = _extract_phrases_and_keywords(topic)
     handles = _find_community_handles(phrases, keywords)
 
@@ -121,23 +168,18 @@ def build_topic_queries(topic: str) -> list[str]:
 
     # Build quoted terms for OR chaining
     # Multi-word phrases get quotes, single keywords are quoted too for exactness
-    all_terms = []
-    for p in phrases:
-        all_terms.append(f'"{p}"')
-    for k in keywords:
-        all_terms.append(f'"{k}"')
+    all_terms = [f'"{t}"' for t in phrases + keywords]
 
     # Query 1: Broad sweep — all terms OR'd
     if all_terms:
         or_chain = " OR ".join(all_terms[:10])
-        queries.append(f"({or_chain}) {NEGATIVE_FILTER_STR}")
+        queries.append("(" + or_chain + _FILTER_SUFFIX)
 
     # Query 2: Top terms + signal words (narrower, higher quality)
     top_terms = all_terms[:5]
     if top_terms:
         or_top = " OR ".join(top_terms)
-        signal_words = '"release" OR "new" OR "benchmark" OR "comparison" OR "update" OR "workflow" OR "tutorial" OR "guide"'
-        queries.append(f"({or_top}) ({signal_words}) {NEGATIVE_FILTER_STR}")
+        queries.append("(" + or_top + _SIGNAL_FILTER_SUFFIX)
 
     # Query 3: Community accounts — from/mentioning known handles
     if handles:
@@ -145,10 +187,35 @@ def build_topic_queries(topic: str) -> list[str]:
         # Pair with at least one topic term so we don't get all their tweets
         if all_terms:
             anchor = " OR ".join(all_terms[:3])
-            queries.append(f"({handle_or}) ({anchor}) {NEGATIVE_FILTER_STR}")
+            queries.append("(" + handle_or + ") (" + anchor + _FILTER_SUFFIX)
 
     # Fallback: quote the whole topic
     if not queries:
         queries.append(f'"{topic}" {NEGATIVE_FILTER_STR}')
 
-    return queries
+    return tuple(queries)
+
+
+# Behaviour checks, run by the daily workflow via `python3 -m doctest queries.py`
+__test__ = {
+    "handles_follow_term_order": """
+        >>> _find_community_handles((), ("local", "sdxl"))[:3]
+        ['@ggaboratory', '@ollama', '@LMStudioAI']
+    """,
+    "versioned_spellings_match": """
+        >>> _find_community_handles((), ("llama3",))
+        ['@ggaboratory', '@MetaAI']
+        >>> _find_community_handles(("llama2 finetune",), ())
+        ['@ggaboratory', '@MetaAI']
+        >>> _find_community_handles((), ("sdxl1.0",))
+        ['@StabilityAI', '@ClybAI', '@KohakuBlueleaf', '@ai_pictures']
+        >>> _find_community_handles((), ("fluxdev", "flux1"))
+        ['@baboratory', '@bfl_ml']
+        >>> _find_community_handles((), ("ponyv6",))
+        ['@PurpleSmartAI']
+    """,
+    "no_match_inside_words": """
+        >>> _find_community_handles((), ("ollama",))
+        ['@ollama']
+    """,
+}
@@ -20,92 +20,182 @@ Source-specific env vars:
   X_BEARER_TOKEN      — X API bearer token (or X_CONSUMER_KEY + X_API_KEY)
 """
 
+import gzip
 import json
 import os
+import socket
 import sys
 import argparse
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.error import HTTPError
 
 from config import (
     DEFAULT_QUERIES, LOOKBACK_HOURS, MAX_RESULTS_PER_QUERY,
-    LLM_MODEL, MAX_TOKENS, SCOUT_FOCUS,
+    LLM_MODEL, MAX_TOKENS, SCOUT_FOCUS, LLM_GZIP_REQUESTS,
 )
 from prompt import build_system_prompt
 from queries import build_topic_queries
-from sources import ADAPTERS, Post
+from sources import ADAPTERS, Post, load_adapter
+from sources.net import http_stream
 
 
 # ─── FETCH POSTS ─────────────────────────────────────────────────────────────
 
+# Backstop only: every request in this codebase passes its own timeout, so
+# this default applies just to a future call site that forgets one
+SOCKET_TIMEOUT = 25
+
+
+def _fetch_source(name: str, topic: str, queries: list[str] | None) -> list[Post]:
+    """Fetch posts from a single source adapter, swallowing adapter failures."""
+    adapter = load_adapter(name)()
+    # Only pass raw queries to X adapter (Reddit uses topic directly)
+    adapter_queries = queries if name == "x" else None
+    try:
+        return adapter.fetch(
+            topic=topic,
+            lookback_hours=LOOKBACK_HOURS,
+            max_results=MAX_RESULTS_PER_QUERY,
+            queries=adapter_queries,
+        )
+    except Exception as e:
+        print(f"⚠ {name} source failed: {e}", file=sys.stderr)
+        return []
+
+
 def fetch_posts(source_names: list[str], topic: str, queries: list[str] | None) -> list[Post]:
-    """Fetch posts from one or more source adapters."""
-    all_posts: list[Post] = []
+    """Fetch posts from one or more source adapters.
 
+    Adapters are network-bound and independent, so they run concurrently.
+    Results are merged in ``source_names`` order regardless of finish order.
+    Progress lines on stderr are not reordered: with several sources, their
+    lines interleave as the adapters run.
+    """
     for name in source_names:
-        adapter_cls = ADAPTERS.get(name)
-        if not adapter_cls:
+        if name not in ADAPTERS:
             print(f"❌ Unknown source: {name!r}. Available: {', '.join(ADAPTERS)}", file=sys.stderr)
             sys.exit(1)
 
-        adapter = adapter_cls()
-        # Only pass raw queries to X adapter (Reddit uses topic directly)
-        adapter_queries = queries if name == "x" else None
-        try:
-            posts = adapter.fetch(
-                topic=topic,
-                lookback_hours=LOOKBACK_HOURS,
-                max_results=MAX_RESULTS_PER_QUERY,
-                queries=adapter_queries,
-            )
+    all_posts: list[Post] = []
+    with ThreadPoolExecutor(max_workers=len(source_names)) as pool:
+        results = pool.map(lambda name: _fetch_source(name, topic, queries), source_names)
+        for posts in results:
             all_posts.extend(posts)
-        except Exception as e:
-            print(f"⚠ {name} source failed: {e}", file=sys.stderr)
 
     return all_posts
 
 
-def posts_to_json(posts: list[Post], topic: str) -> str:
-    """Serialize posts to JSON for the LLM."""
-    data = {
+def posts_to_data(posts: list[Post], topic: str) -> dict:
+    """Wrap posts in the payload envelope sent to the LLM and saved to disk."""
+    return {
         "pulled_at": datetime.now().isoformat(),
         "topic": topic,
         "total_posts": len(posts),
-        "posts": [asdict(p) for p in posts],
+        "posts": [p.to_dict() for p in posts],
     }
-    return json.dumps(data, indent=2)
+
+
+def posts_to_json(data: dict) -> str:
+    """Serialize a posts payload compactly for the LLM.
+
+    No indentation or padding: whitespace costs upload bytes and prompt
+    tokens without helping the model. Non-ASCII is kept as-is rather than
+    escaped to \\uXXXX for the same reason.
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
 
 # ─── GENERATE BRIEF ─────────────────────────────────────────────────────────
 
+NANOGPT_URL = "https://nano-gpt.com/api/v1/chat/completions"
+
+# Cleared once the endpoint rejects a gzipped body, so later calls in this
+# process go straight to the plain request
+_gzip_requests = LLM_GZIP_REQUESTS
+
+
+def _read_completion(resp) -> str:
+    """Print the completion to stdout as it arrives and return the full text.
+
+    Handles an OpenAI-style SSE stream; falls back to a plain JSON body if
+    the endpoint ignored ``stream``. Raises if the stream reports an error or
+    ends without any content.
+    """
+    if "text/event-stream" not in resp.headers.get("Content-Type", ""):
+        content = json.load(resp)["choices"][0]["message"]["content"]
+        print(content)
+        return content
+
+    parts = []
+    for line in resp:
+        line = line.strip()
+        if not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            break
+        event = json.loads(payload)
+        error = event.get("error")
+        if error:
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise RuntimeError(f"stream error: {message}")
+        choices = event.get("choices") or []
+        delta = (choices[0].get("delta") or {}).get("content") if choices else None
+        if delta:
+            print(delta, end="", flush=True)
+            parts.append(delta)
+    if not parts:
+        raise RuntimeError("stream ended without any content")
+    print()
+    return "".join(parts)
+
+
 def generate_brief(posts_json: str, system_prompt: str) -> str:
+    """Generate the brief, streaming it to stdout. Returns the full text."""
     api_key = os.environ.get("NANOGPT_API_KEY", "")
     if not api_key:
         print("❌ NANOGPT_API_KEY not set", file=sys.stderr)
         sys.exit(1)
 
-    from urllib.request import Request, urlopen
-
     body = json.dumps({
         "model": LLM_MODEL,
         "max_tokens": MAX_TOKENS,
+        "stream": True,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": f"Brief me.\n\n{posts_json}"},
         ],
-    }).encode()
+    }, separators=(",", ":"), ensure_ascii=False).encode()
 
-    req = Request("https://nano-gpt.com/api/v1/chat/completions", data=body, method="POST")
-    req.add_header("Content-Type", "application/json")
-    req.add_header("Authorization", f"Bearer {api_key}")
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+        "Accept": "text/event-stream",
+    }
 
     print("  🧠 Generating brief...", file=sys.stderr)
 
+    global _gzip_requests
     try:
-        with urlopen(req, timeout=120) as resp:
-            data = json.loads(resp.read().decode())
-            return data["choices"][0]["message"]["content"]
+        # The posts JSON is highly repetitive (keys, URLs) and compresses well.
+        # Any HTTP error on the compressed body may be the endpoint rejecting
+        # it, so resend uncompressed and stop compressing for this process.
+        for compress in ((True, False) if _gzip_requests else (False,)):
+            if compress:
+                req_body, req_headers = gzip.compress(body, compresslevel=3), {**headers, "Content-Encoding": "gzip"}
+            else:
+                req_body, req_headers = body, headers
+            try:
+                # Stream so the brief shows up as it's generated, not after
+                with http_stream(NANOGPT_URL, req_body, req_headers, timeout=120) as resp:
+                    return _read_completion(resp)
+            except HTTPError as e:
+                if not compress:
+                    raise
+                _gzip_requests = False
+                print(f"  ⚠ gzip request body rejected ({e.code}), resending uncompressed", file=sys.stderr)
     except Exception as e:
         print(f"❌ LLM API error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -133,6 +223,7 @@ def main():
         help="Source to pull from (default: x)",
     )
     args = parser.parse_args()
+    socket.setdefaulttimeout(SOCKET_TIMEOUT)
 
     # Resolve topic: CLI --topic > SCOUT_FOCUS env var > default
     topic = args.topic or SCOUT_FOCUS or ""
@@ -160,22 +251,20 @@ def main():
     # Step 1: Get posts
     if args.from_file:
         print(f"📂 Loading {args.from_file}", file=sys.stderr)
-        posts_json = Path(args.from_file).read_text()
+        posts_data = json.loads(Path(args.from_file).read_text())
     else:
         print(f"📡 Pulling from: {', '.join(source_names)}", file=sys.stderr)
         posts = fetch_posts(source_names, topic or "local AI", queries)
         if not posts:
             print("⚠ No posts found from any source.", file=sys.stderr)
-        posts_json = posts_to_json(posts, topic or "local AI")
+        posts_data = posts_to_data(posts, topic or "local AI")
         total = len(posts)
         print(f"  ✅ {total} total posts", file=sys.stderr)
 
-    # Step 2: Generate brief
-    brief = generate_brief(posts_json, system_prompt)
-
-    # Step 3: Output
-    print(brief)
+    # Step 2: Generate brief (streamed to stdout as it arrives)
+    brief = generate_brief(posts_to_json(posts_data), system_prompt)
 
+    # Step 3: Save
     save_posts = args.save_posts or args.save_tweets
     if args.save or save_posts:
         briefs_dir = Path(__file__).parent / "briefs"
@@ -189,7 +278,10 @@ def main():
 
         if save_posts:
             posts_path = briefs_dir / f"{date_str}-posts.json"
-            posts_path.write_text(posts_json)
+            # Saved copy stays pretty-printed for humans; only the LLM gets it compact.
+            # json.dumps output is pure ASCII, so write the bytes directly and
+            # skip the text-mode wrapper and its locale-dependent encoding.
+            posts_path.write_bytes(json.dumps(posts_data, indent=2).encode("ascii"))
             print(f"  💾 Posts → {posts_path}", file=sys.stderr)
 
     print("✅ Done.", file=sys.stderr)
@@ -1,30 +1,41 @@
+import importlib
+
 from .base import Post, SourceAdapter
-from .x import XAdapter
-from .reddit import RedditAdapter
-from .civitai import CivitAIAdapter
-from .arxiv import ArxivAdapter
-from .lobsters import LobstersAdapter
-from .hackernews import HackerNewsAdapter
-from .github import GitHubAdapter
-from .producthunt import ProductHuntAdapter
-from .huggingface import HuggingFaceAdapter
-from .bluesky import BlueskyAdapter
 
+# Source name → (module, class). Adapter modules are imported on first use,
+# so a single-source run doesn't pay to load every adapter.
 ADAPTERS = {
-    "x": XAdapter,
-    "reddit": RedditAdapter,
-    "civitai": CivitAIAdapter,
-    "arxiv": ArxivAdapter,
-    "lobsters": LobstersAdapter,
-    "hackernews": HackerNewsAdapter,
-    "github": GitHubAdapter,
-    "producthunt": ProductHuntAdapter,
-    "huggingface": HuggingFaceAdapter,
-    "bluesky": BlueskyAdapter,
+    "x": (".x", "XAdapter"),
+    "reddit": (".reddit", "RedditAdapter"),
+    "civitai": (".civitai", "CivitAIAdapter"),
+    "arxiv": (".arxiv", "ArxivAdapter"),
+    "lobsters": (".lobsters", "LobstersAdapter"),
+    "hackernews": (".hackernews", "HackerNewsAdapter"),
+    "github": (".github", "GitHubAdapter"),
+    "producthunt": (".producthunt", "ProductHuntAdapter"),
+    "huggingface": (".huggingface", "HuggingFaceAdapter"),
+    "bluesky": (".bluesky", "BlueskyAdapter"),
 }
 
+_CLASS_MODULES = {cls: module for module, cls in ADAPTERS.values()}
+
+
+def load_adapter(name: str) -> type[SourceAdapter]:
+    """Import and return the adapter class registered under a source name."""
+    module, cls = ADAPTERS[name]
+    return getattr(importlib.import_module(module, __name__), cls)
+
+
+def __getattr__(name: str):
+    # PEP 562: resolve `from sources import XAdapter` lazily
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
+
 __all__ = [
-    "Post", "SourceAdapter", "ADAPTERS",
+    "Post", "SourceAdapter", "ADAPTERS", "load_adapter",
     "XAdapter", "RedditAdapter", "CivitAIAdapter",
     "ArxivAdapter", "LobstersAdapter", "HackerNewsAdapter",
     "GitHubAdapter", "ProductHuntAdapter", "HuggingFaceAdapter",
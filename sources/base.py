@@ -1,8 +1,9 @@
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Normalized post from any source."""
     source: str        # "x", "reddit", "hackernews", "civitai"
@@ -13,6 +14,15 @@ class Post:
     score: int = 0     # upvotes, likes, etc.
     metadata: dict = field(default_factory=dict)  # source-specific extras
 
+    def to_dict(self) -> dict:
+        """Shallow dict of the fields for JSON serialization.
+
+        Unlike dataclasses.asdict this doesn't deep-copy ``metadata`` —
+        the result is only ever handed straight to json.dumps. Built from
+        ``__slots__``, so new fields are picked up automatically.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class SourceAdapter(ABC):
     @abstractmethod
@@ -25,3 +35,21 @@ class SourceAdapter(ABC):
     @abstractmethod
     def name(self) -> str:
         ...
+
+    @staticmethod
+    def _dedup_queries(queries: list[str] | None) -> list[str] | None:
+        """Drop queries that differ only by case or surrounding whitespace.
+
+        The first spelling of each query is kept, in its original position;
+        skipped duplicates are logged to stderr.
+        """
+        if not queries:
+            return queries
+        unique: dict[str, str] = {}
+        for query in queries:
+            key = query.strip().lower()
+            if key in unique:
+                print(f"    ↷ Skipping duplicate query: {query!r}", file=sys.stderr)
+            else:
+                unique[key] = query
+        return list(unique.values())
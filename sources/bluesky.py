@@ -2,11 +2,12 @@
 
 import json
 import sys
+from collections.abc import Iterator
 from datetime import datetime, timezone, timedelta
 from urllib.parse import quote_plus
-from urllib.request import Request, urlopen
 
 from .base import Post, SourceAdapter
+from .net import http_request
 
 API_BASE = "https://public.api.bsky.app/xrpc"
 USER_AGENT = "xscout/1.0 (local-ai-scout; stdlib)"
@@ -14,12 +15,9 @@ USER_AGENT = "xscout/1.0 (local-ai-scout; stdlib)"
 
 def _bsky_get(url: str) -> dict:
     """Fetch a Bluesky API endpoint."""
-    req = Request(url)
-    req.add_header("User-Agent", USER_AGENT)
-    req.add_header("Accept", "application/json")
+    headers = {"User-Agent": USER_AGENT, "Accept": "application/json", "Accept-Encoding": "gzip"}
     try:
-        with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+        return json.loads(http_request(url, headers=headers, timeout=30))
     except Exception as e:
         print(f"  ⚠ Bluesky request failed: {e}", file=sys.stderr)
         return {}
@@ -44,18 +42,20 @@ class BlueskyAdapter(SourceAdapter):
     def fetch(self, topic: str, lookback_hours: int = 24, max_results: int = 100,
               queries: list[str] | None = None) -> list[Post]:
         search_terms = self._build_search_terms(topic, queries)
-        since = (datetime.now(timezone.utc) - timedelta(hours=lookback_hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        since = (
+            datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+        ).isoformat(timespec="seconds").replace("+00:00", "Z")
 
         posts: list[Post] = []
         seen_uris: set[str] = set()
 
         for i, term in enumerate(search_terms, 1):
             print(f"  [bluesky {i}/{len(search_terms)}] {term[:50]}...", file=sys.stderr)
-            results = self._search(term, since, min(max_results, 100))
-            for post in results:
-                if post.url not in seen_uris:
-                    seen_uris.add(post.url)
-                    posts.append(post)
+            # Dedup on the raw AT URI before building the web URL and Post
+            for uri, item in self._search_iter(term, since, min(max_results, 100)):
+                if uri not in seen_uris:
+                    seen_uris.add(uri)
+                    posts.append(self._build_post(uri, item))
 
         print(f"  -> {len(posts)} posts from Bluesky", file=sys.stderr)
         return posts
@@ -72,45 +72,38 @@ class BlueskyAdapter(SourceAdapter):
             terms = [topic]
         return terms
 
-    def _search(self, query: str, since: str, limit: int) -> list[Post]:
-        """Search Bluesky for posts matching the query."""
+    def _search_iter(self, query: str, since: str, limit: int) -> Iterator[tuple[str, dict]]:
+        """Search Bluesky for posts matching the query, yielding (uri, item) pairs."""
         encoded = quote_plus(query)
         url = f"{API_BASE}/app.bsky.feed.searchPosts?q={encoded}&sort=latest&limit={limit}&since={since}"
         data = _bsky_get(url)
-        return self._normalize(data)
-
-    def _normalize(self, data: dict) -> list[Post]:
-        """Convert Bluesky API response into normalized Post objects."""
-        posts = []
-
         for item in data.get("posts", []):
-            author_info = item.get("author", {})
-            did = author_info.get("did", "")
-            handle = author_info.get("handle", "unknown")
-
-            record = item.get("record", {})
-            text = record.get("text", "")
-            created_at = record.get("createdAt", "")
-
-            uri = item.get("uri", "")
-            url = _post_url(uri, did)
-
-            like_count = item.get("likeCount", 0)
-            repost_count = item.get("repostCount", 0)
-
-            posts.append(Post(
-                source="bluesky",
-                author=f"@{handle}",
-                text=text,
-                url=url,
-                timestamp=created_at,
-                score=like_count,
-                metadata={
-                    "did": did,
-                    "repost_count": repost_count,
-                    "reply_count": item.get("replyCount", 0),
-                    "quote_count": item.get("quoteCount", 0),
-                },
-            ))
-
-        return posts
+            yield item.get("uri", ""), item
+
+    def _build_post(self, uri: str, item: dict) -> Post:
+        """Convert a single Bluesky API post item into a normalized Post."""
+        author_info = item.get("author", {})
+        did = author_info.get("did", "")
+        handle = author_info.get("handle", "unknown")
+
+        record = item.get("record", {})
+        text = record.get("text", "")
+        created_at = record.get("createdAt", "")
+
+        like_count = item.get("likeCount", 0)
+        repost_count = item.get("repostCount", 0)
+
+        return Post(
+            source="bluesky",
+            author=f"@{handle}",
+            text=text,
+            url=_post_url(uri, did),
+            timestamp=created_at,
+            score=like_count,
+            metadata={
+                "did": did,
+                "repost_count": repost_count,
+                "reply_count": item.get("replyCount", 0),
+                "quote_count": item.get("quoteCount", 0),
+            },
+        )
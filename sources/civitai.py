@@ -64,7 +64,7 @@ def _civitai_get(url: str) -> dict:
     req.add_header("User-Agent", USER_AGENT)
     try:
         with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+            return json.load(resp)
     except Exception as e:
         print(f"  ⚠ CivitAI request failed: {e}", file=sys.stderr)
         return {}
@@ -41,7 +41,7 @@ def _github_get(url: str) -> dict:
 
     try:
         with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+            return json.load(resp)
     except Exception as e:
         print(f"  ⚠ GitHub request failed: {e}", file=sys.stderr)
         return {}
@@ -7,13 +7,70 @@ Uses the free Algolia HN Search API (no auth required):
 
 import sys
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from urllib.request import Request, urlopen
-from urllib.parse import urlencode
+from urllib.parse import quote
 
 from .base import Post, SourceAdapter
+from .net import http_request
 
 BASE_URL = "https://hn.algolia.com/api/v1"
+ITEM_URL_TMPL = "https://news.ycombinator.com/item?id=%s"
+
+# Algolia gzips JSON on request; sources.net decompresses it
+REQUEST_HEADERS = {"User-Agent": "xscout/1.0", "Accept-Encoding": "gzip"}
+
+# Query string for Algolia search; only the query text needs escaping
+_HN_PARAM_TMPL = "query=%s&tags=%s&numericFilters=created_at_i%%3E%d&hitsPerPage=%d"
+
+# Searches run concurrently; keep in-flight requests polite for Algolia
+MAX_CONCURRENT_REQUESTS = 8
+
+_UTC = timezone.utc
+
+STORY_HITS_PER_PAGE = 20
+COMMENT_HITS_PER_PAGE = 50
+
+
+def _iso_utc(ts: int) -> str:
+    """Format a UTC epoch as ISO 8601, same as datetime.fromtimestamp(ts, utc).isoformat().
+
+    Plain gmtime + %-formatting, skipping datetime's general-purpose machinery.
+    """
+    t = time.gmtime(ts)
+    return "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec,
+    )
+
+
+def _hit_to_post(hit: dict, kind: str = "story") -> Post | None:
+    """Convert an Algolia hit into a Post; ``kind`` is the search tag it came from."""
+    get = hit.get
+    object_id = get("objectID")
+    if not object_id:
+        return None
+
+    if kind == "comment":
+        story_title = get("story_title") or ""
+        title = f"[Comment on: {story_title}]" if story_title else "[Comment]"
+        body = get("comment_text") or ""
+        metadata = {"type": "comment", "story_title": story_title}
+    else:
+        title = get("title") or ""
+        body = get("story_text") or get("url") or ""
+        metadata = {"num_comments": get("num_comments") or 0, "story_url": get("url", "")}
+
+    created_at_i = get("created_at_i")
+    return Post(
+        source="hackernews",
+        author=get("author", ""),
+        text=f"{title}\n\n{body}".strip() if body else title,
+        url=ITEM_URL_TMPL % object_id,
+        timestamp=_iso_utc(created_at_i) if created_at_i else "",
+        score=get("points") or 0,
+        metadata=metadata,
+    )
 
 
 class HackerNewsAdapter(SourceAdapter):
@@ -23,35 +80,36 @@ class HackerNewsAdapter(SourceAdapter):
 
     def fetch(self, topic: str, lookback_hours: int = 24, max_results: int = 100,
               queries: list[str] | None = None) -> list[Post]:
-        search_terms = self._build_search_terms(topic, queries)
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+        search_terms = self._dedup_queries(self._build_search_terms(topic, queries))
+        cutoff = datetime.now(_UTC) - timedelta(hours=lookback_hours)
         cutoff_ts = int(cutoff.timestamp())
 
-        seen_urls: set[str] = set()
-        posts: list[Post] = []
-
+        tasks = []
         for i, query in enumerate(search_terms, 1):
             print(f"  [{i}/{len(search_terms)}] HN: {query[:60]}...", file=sys.stderr)
-
-            # Search by relevance (stories)
-            story_hits = self._search(query, cutoff_ts, tags="story", endpoint="search")
-            # Search by date (stories) — catches very recent posts
-            recent_hits = self._search(query, cutoff_ts, tags="story", endpoint="search_by_date")
-            # Search comments for signal
-            comment_hits = self._search(query, cutoff_ts, tags="comment",
-                                        endpoint="search", hits_per_page=50)
-
-            for hit in story_hits + recent_hits:
-                post = self._hit_to_post(hit)
-                if post and post.url not in seen_urls:
-                    seen_urls.add(post.url)
-                    posts.append(post)
-
-            for hit in comment_hits:
-                post = self._comment_to_post(hit)
-                if post and post.url not in seen_urls:
-                    seen_urls.add(post.url)
-                    posts.append(post)
+            tasks += [
+                # Stories (relevance, plus by-date when needed)
+                (self._story_hits, query, cutoff_ts),
+                # Search comments for signal
+                (self._search, query, cutoff_ts, "comment", "search", COMMENT_HITS_PER_PAGE),
+            ]
+
+        # Capped by MAX_CONCURRENT_REQUESTS to stay polite to Algolia
+        workers = min(MAX_CONCURRENT_REQUESTS, len(tasks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda task: task[0](*task[1:]), tasks))
+
+        # Dedup by item URL; setdefault keeps the first-seen post and the
+        # dict keeps first-seen order
+        by_url: dict[str, Post] = {}
+        for i in range(len(search_terms)):
+            story_hits, comment_hits = results[2 * i:2 * i + 2]
+            for kind, hits in (("story", story_hits), ("comment", comment_hits)):
+                for hit in hits or ():
+                    post = _hit_to_post(hit, kind)
+                    if post:
+                        by_url.setdefault(post.url, post)
+        posts = list(by_url.values())
 
         print(f"  -> {len(posts)} HN posts across {len(search_terms)} queries", file=sys.stderr)
         return posts
@@ -64,86 +122,33 @@ class HackerNewsAdapter(SourceAdapter):
             terms = [topic]
         return terms
 
+    def _story_hits(self, query: str, cutoff_ts: int) -> list[dict]:
+        """Stories for a query: by relevance, then by date unless that page came back partial.
+
+        Both searches share the created_at_i cutoff, so a partial relevance page
+        already holds every matching story in the window — the by-date pass
+        would return the same items. If the relevance search failed, by-date
+        still runs.
+        """
+        hits = self._search(query, cutoff_ts, tags="story", endpoint="search",
+                            hits_per_page=STORY_HITS_PER_PAGE)
+        if hits is None or len(hits) >= STORY_HITS_PER_PAGE:
+            # Search by date (stories) — catches very recent posts
+            by_date = self._search(query, cutoff_ts, tags="story", endpoint="search_by_date",
+                                   hits_per_page=STORY_HITS_PER_PAGE)
+            hits = (hits or []) + (by_date or [])
+        return hits
+
     @staticmethod
     def _search(query: str, cutoff_ts: int, tags: str = "story",
-                endpoint: str = "search", hits_per_page: int = 20) -> list[dict]:
-        params = urlencode({
-            "query": query,
-            "tags": tags,
-            "numericFilters": f"created_at_i>{cutoff_ts}",
-            "hitsPerPage": hits_per_page,
-        })
+                endpoint: str = "search", hits_per_page: int = 20) -> list[dict] | None:
+        """One Algolia search page. Returns None (not []) if the request failed."""
+        params = _HN_PARAM_TMPL % (quote(query, safe=""), tags, cutoff_ts, hits_per_page)
         url = f"{BASE_URL}/{endpoint}?{params}"
-        req = Request(url)
-        req.add_header("User-Agent", "xscout/1.0")
 
         try:
-            with urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read().decode())
-                return data.get("hits", [])
+            data = json.loads(http_request(url, headers=REQUEST_HEADERS, timeout=30))
+            return data.get("hits", [])
         except Exception as e:
             print(f"    ⚠ HN API error: {e}", file=sys.stderr)
-            return []
-
-    @staticmethod
-    def _hit_to_post(hit: dict) -> Post | None:
-        object_id = hit.get("objectID", "")
-        if not object_id:
             return None
-
-        title = hit.get("title") or ""
-        body = hit.get("story_text") or hit.get("url") or ""
-        author = hit.get("author", "")
-        points = hit.get("points") or 0
-        num_comments = hit.get("num_comments") or 0
-        created_at_i = hit.get("created_at_i")
-
-        timestamp = ""
-        if created_at_i:
-            timestamp = datetime.fromtimestamp(created_at_i, tz=timezone.utc).isoformat()
-
-        text = f"{title}\n\n{body}".strip() if body else title
-
-        return Post(
-            source="hackernews",
-            author=author,
-            text=text,
-            url=f"https://news.ycombinator.com/item?id={object_id}",
-            timestamp=timestamp,
-            score=points,
-            metadata={
-                "num_comments": num_comments,
-                "story_url": hit.get("url", ""),
-            },
-        )
-
-    @staticmethod
-    def _comment_to_post(hit: dict) -> Post | None:
-        object_id = hit.get("objectID", "")
-        if not object_id:
-            return None
-
-        comment_text = hit.get("comment_text") or ""
-        author = hit.get("author", "")
-        story_title = hit.get("story_title") or ""
-        created_at_i = hit.get("created_at_i")
-
-        timestamp = ""
-        if created_at_i:
-            timestamp = datetime.fromtimestamp(created_at_i, tz=timezone.utc).isoformat()
-
-        title = f"[Comment on: {story_title}]" if story_title else "[Comment]"
-        text = f"{title}\n\n{comment_text}".strip() if comment_text else title
-
-        return Post(
-            source="hackernews",
-            author=author,
-            text=text,
-            url=f"https://news.ycombinator.com/item?id={object_id}",
-            timestamp=timestamp,
-            score=hit.get("points") or 0,
-            metadata={
-                "type": "comment",
-                "story_title": story_title,
-            },
-        )
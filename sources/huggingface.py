@@ -33,7 +33,7 @@ def _hf_get(url: str) -> list | dict:
     req.add_header("User-Agent", USER_AGENT)
     try:
         with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+            return json.load(resp)
     except Exception as e:
         print(f"  ⚠ HuggingFace request failed: {e}", file=sys.stderr)
         return []
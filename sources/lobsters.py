@@ -34,7 +34,7 @@ def _lobsters_get(url: str) -> list | None:
     req.add_header("User-Agent", USER_AGENT)
     try:
         with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+            return json.load(resp)
     except Exception as e:
         print(f"  ⚠ Lobsters request failed: {e}", file=sys.stderr)
         return None
@@ -0,0 +1,212 @@
+"""Keep-alive HTTP helper shared by source adapters and the LLM call.
+
+urlopen() opens a fresh TCP + TLS connection for every request. This module
+keeps a small pool of idle http.client connections per host and hands them
+back out, so repeat calls to the same API skip the handshake. The pool is
+shared across threads: a connection is checked out for one request at a time.
+
+Redirects are followed the way urlopen follows them. When an HTTP(S)_PROXY
+applies to a URL, the request goes through urlopen instead, so proxy settings
+keep working.
+
+Stdlib only.
+"""
+
+import gzip
+import http.client
+import io
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+USER_AGENT = "xscout/1.0 (local-ai-scout; stdlib)"
+
+# Idle connections kept per host — enough for the adapters' worker pools
+MAX_IDLE_PER_HOST = 8
+
+# Same hop limit as urllib's HTTPRedirectHandler
+MAX_REDIRECTS = 10
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+# Errors that mean a reused keep-alive connection was closed by the server
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_lock = threading.Lock()
+
+
+def _checkout(key: tuple[str, str], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    """Take an idle connection for ``key`` or open a new one. Returns (conn, reused)."""
+    with _lock:
+        idle = _idle.get(key)
+        conn = idle.pop() if idle else None
+
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    scheme, host = key
+    cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    return cls(host, timeout=timeout), False
+
+
+def _checkin(key: tuple[str, str], conn: http.client.HTTPConnection):
+    """Return a connection to the idle pool, closing it if the pool is full."""
+    with _lock:
+        idle = _idle.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _proxied(url: str) -> bool:
+    """True if urlopen would send ``url`` through a proxy (HTTP(S)_PROXY, minus NO_PROXY)."""
+    parts = urlsplit(url)
+    return parts.scheme in getproxies() and not proxy_bypass(parts.hostname or "")
+
+
+def _urlopen(url: str, data: bytes | None, headers: dict | None, method: str | None,
+             timeout: float) -> http.client.HTTPResponse:
+    """Proxy fallback: the same request through urlopen, which honours proxy settings."""
+    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+    return urlopen(Request(url, data, headers, method=method), timeout=timeout)
+
+
+def _send_once(url: str, data: bytes | None, headers: dict, method: str,
+               timeout: float) -> tuple[tuple[str, str], http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Send one request on a pooled connection. Returns (pool key, conn, response)."""
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    while True:
+        conn, reused = _checkout(key, timeout)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            return key, conn, conn.getresponse()
+        except _STALE_ERRORS:
+            conn.close()
+            # A pooled connection the server already dropped — retry on a
+            # fresh one. A fresh connection failing is a real error.
+            if reused:
+                continue
+            raise
+        except Exception:
+            conn.close()
+            raise
+
+
+def _release(key: tuple[str, str], conn: http.client.HTTPConnection, resp: http.client.HTTPResponse):
+    """Pool the connection again once its response body has been fully read."""
+    if resp.will_close:
+        conn.close()
+    else:
+        _checkin(key, conn)
+
+
+def _send(url: str, data: bytes | None, headers: dict | None, method: str | None,
+          timeout: float) -> tuple[str, tuple[str, str], http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Send a request, following redirects. Returns (final url, pool key, conn, response).
+
+    Mirrors urlopen: any redirect of a GET/HEAD is followed; a redirected
+    POST becomes a body-less GET on 301/302/303, while 307/308 on a POST are
+    returned as-is (and so raise HTTPError). After MAX_REDIRECTS hops the
+    last 3xx response is returned.
+    """
+    method = method or ("POST" if data is not None else "GET")
+    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+
+    for _ in range(MAX_REDIRECTS):
+        key, conn, resp = _send_once(url, data, headers, method, timeout)
+        location = resp.headers.get("Location")
+        if resp.status not in _REDIRECT_CODES or not location:
+            return url, key, conn, resp
+        if method not in ("GET", "HEAD"):
+            if resp.status in (307, 308):
+                return url, key, conn, resp
+            method, data = "GET", None
+            headers = {k: v for k, v in headers.items()
+                       if k.lower() not in ("content-type", "content-length", "content-encoding")}
+
+        # Drain the redirect body so the connection can be reused
+        try:
+            resp.read()
+        except Exception:
+            conn.close()
+            raise
+        _release(key, conn, resp)
+        url = urljoin(url, location)
+
+    key, conn, resp = _send_once(url, data, headers, method, timeout)
+    return url, key, conn, resp
+
+
+def _raise_for_status(url: str, resp: http.client.HTTPResponse, body: bytes):
+    if not 200 <= resp.status < 300:
+        raise HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+
+
+def http_request(url: str, data: bytes | None = None, headers: dict | None = None,
+                 method: str | None = None, timeout: float = 30) -> bytes:
+    """Send a request over a pooled connection and return the response body.
+
+    Mirrors urlopen's contract closely enough to drop in: POST when ``data``
+    is given, redirects are followed, and non-2xx responses raise
+    urllib.error.HTTPError (with the response headers and body attached).
+
+    gzip-encoded responses are decompressed transparently; callers opt in by
+    sending ``Accept-Encoding: gzip``.
+    """
+    if _proxied(url):
+        with _urlopen(url, data, headers, method, timeout) as resp:
+            body = resp.read()
+    else:
+        url, key, conn, resp = _send(url, data, headers, method, timeout)
+        try:
+            body = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        _release(key, conn, resp)
+
+    if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+        body = gzip.decompress(body)
+
+    _raise_for_status(url, resp, body)
+    return body
+
+
+@contextmanager
+def http_stream(url: str, data: bytes | None = None, headers: dict | None = None,
+                method: str | None = None, timeout: float = 30) -> Iterator[http.client.HTTPResponse]:
+    """Like http_request, but yield the open response for incremental reads.
+
+    Iterating the response yields lines as they arrive, which suits
+    server-sent events. The connection is closed afterwards rather than
+    returned to the pool, since the body may not have been fully consumed.
+    """
+    if _proxied(url):
+        with _urlopen(url, data, headers, method, timeout) as resp:
+            yield resp
+        return
+
+    url, _, conn, resp = _send(url, data, headers, method, timeout)
+    try:
+        if not 200 <= resp.status < 300:
+            _raise_for_status(url, resp, resp.read())
+        yield resp
+    finally:
+        conn.close()
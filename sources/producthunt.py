@@ -4,55 +4,48 @@ Product Hunt retired their public API in 2024. This adapter uses the public
 Atom feed at https://www.producthunt.com/feed which returns ~50 recent launches.
 Posts are filtered client-side against topic keywords.
 
-Stdlib only: xml.etree.ElementTree for Atom parsing, urllib for HTTP.
+Stdlib only: xml.etree.ElementTree (streaming iterparse) for Atom parsing.
 """
 
+import functools
+import io
 import re
 import sys
 import time
 from datetime import datetime, timezone
-from html.parser import HTMLParser
-from urllib.request import Request, urlopen
-from xml.etree.ElementTree import fromstring
+from html import unescape
+from xml.etree.ElementTree import Element, iterparse
 
 from .base import Post, SourceAdapter
+from .net import http_request
 
 FEED_URL = "https://www.producthunt.com/feed"
 USER_AGENT = "xscout/1.0 (local-ai-scout; stdlib)"
 ATOM_NS = "http://www.w3.org/2005/Atom"
 
+# Namespaced Atom tags, as ElementTree reports them
+_ENTRY = f"{{{ATOM_NS}}}entry"
+_TITLE = f"{{{ATOM_NS}}}title"
+_CONTENT = f"{{{ATOM_NS}}}content"
+_PUBLISHED = f"{{{ATOM_NS}}}published"
+_LINK = f"{{{ATOM_NS}}}link"
+_AUTHOR = f"{{{ATOM_NS}}}author"
+_NAME = f"{{{ATOM_NS}}}name"
+_ID = f"{{{ATOM_NS}}}id"
 
-class _TaglineExtractor(HTMLParser):
-    """Extract the tagline (first <p> text) from Atom entry content HTML."""
 
-    def __init__(self):
-        super().__init__()
-        self._in_p = False
-        self._depth = 0
-        self.tagline = ""
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "p":
-            self._depth += 1
-            if self._depth == 1:
-                self._in_p = True
-
-    def handle_endtag(self, tag):
-        if tag == "p":
-            if self._in_p:
-                self._in_p = False
-            self._depth -= 1
-
-    def handle_data(self, data):
-        if self._in_p and not self.tagline:
-            self.tagline = data.strip()
+# First-<p> tagline extraction: <p> / <p class=..> but not <pre>, <param>, ...
+_P_RE = re.compile(r"<p(?:\s[^>]*)?>(.*?)</p>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
 
 
 def _extract_tagline(html_content: str) -> str:
-    """Parse HTML content from an Atom entry to get the product tagline."""
-    parser = _TaglineExtractor()
-    parser.feed(html_content)
-    return parser.tagline
+    """Get the product tagline: the text of the first non-empty <p> in the entry HTML."""
+    for match in _P_RE.finditer(html_content):
+        text = " ".join(_TAG_RE.sub(" ", match.group(1)).split())
+        if text:
+            return unescape(text)
+    return ""
 
 
 def _parse_atom_date(date_str: str) -> datetime:
@@ -60,58 +53,69 @@ def _parse_atom_date(date_str: str) -> datetime:
 
     Handles formats like: 2026-02-13T07:47:47-08:00
     """
-    # Python 3.7+ fromisoformat handles timezone offsets
     try:
-        dt = datetime.fromisoformat(date_str)
-        return dt.astimezone(timezone.utc)
+        return _parse_iso_utc(date_str)
     except (ValueError, TypeError):
         return datetime.now(timezone.utc)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_iso_utc(date_str: str) -> datetime:
+    """Cached strict half of _parse_atom_date — raises on bad input, so fallbacks aren't cached."""
+    # Python 3.7+ fromisoformat handles timezone offsets
+    dt = datetime.fromisoformat(date_str)
+    # Already UTC (Z / +00:00) — skip the conversion
+    if dt.tzinfo is timezone.utc:
+        return dt
+    return dt.astimezone(timezone.utc)
+
+
+_POST_ID_RE = re.compile(r"Post/(\d+)")
+
+
 def _extract_post_id(entry_id: str) -> str:
     """Extract numeric post ID from Atom entry ID.
 
     Entry IDs look like: tag:www.producthunt.com,2005:Post/1078316
     """
-    match = re.search(r"Post/(\d+)", entry_id)
+    match = _POST_ID_RE.search(entry_id)
     return match.group(1) if match else ""
 
 
-def _topic_matches(title: str, tagline: str, topic: str) -> bool:
-    """Check if a product matches the topic query (case-insensitive keyword match).
+def _topic_pattern(topic: str) -> re.Pattern:
+    """Compile the topic query into one pattern for case-insensitive keyword matching.
 
     Splits the topic on commas and spaces into individual keywords.
-    A product matches if ANY keyword appears in its title or tagline.
+    A product matches if ANY keyword appears in its title or tagline — the
+    whole comma-separated term, or any word (3+ chars) of a multi-word term.
+    Built once per fetch so each entry costs a single regex search.
     """
-    text = f"{title} {tagline}".lower()
     # Split on commas first (for multi-topic like "AI, machine learning")
     terms = [t.strip().lower() for t in topic.split(",") if t.strip()]
     # If no commas, treat the whole topic as a single search term
     if not terms:
         terms = [topic.lower().strip()]
 
+    alternatives = []
     for term in terms:
         # Match the term as a whole phrase first
-        if term in text:
-            return True
+        alternatives.append(term)
         # Also try individual words for multi-word terms
         words = term.split()
-        if len(words) > 1 and any(w in text for w in words if len(w) > 2):
-            return True
+        if len(words) > 1:
+            alternatives.extend(w for w in words if len(w) > 2)
 
-    return False
+    # Match against lowercased text, same as the terms
+    return re.compile("|".join(re.escape(a) for a in dict.fromkeys(alternatives)))
 
 
-def _fetch_feed() -> str:
-    """Fetch the Product Hunt Atom feed."""
-    req = Request(FEED_URL)
-    req.add_header("User-Agent", USER_AGENT)
+def _fetch_feed() -> bytes:
+    """Fetch the Product Hunt Atom feed as raw bytes (the XML declares its encoding)."""
     try:
-        with urlopen(req, timeout=30) as resp:
-            return resp.read().decode()
+        return http_request(FEED_URL, headers={"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}, timeout=30)
     except Exception as e:
         print(f"  ⚠ Product Hunt feed request failed: {e}", file=sys.stderr)
-        return ""
+        return b""
 
 
 class ProductHuntAdapter(SourceAdapter):
@@ -123,14 +127,10 @@ class ProductHuntAdapter(SourceAdapter):
               queries: list[str] | None = None) -> list[Post]:
         print(f"  [producthunt] Fetching feed, filtering for: {topic[:60]}", file=sys.stderr)
 
-        xml_text = _fetch_feed()
-        if not xml_text:
+        xml_bytes = _fetch_feed()
+        if not xml_bytes:
             return []
 
-        root = fromstring(xml_text)
-        entries = root.findall(f"{{{ATOM_NS}}}entry")
-        print(f"  [producthunt] {len(entries)} entries in feed", file=sys.stderr)
-
         cutoff = datetime.now(timezone.utc).replace(
             hour=0, minute=0, second=0, microsecond=0
         )
@@ -145,61 +145,86 @@ class ProductHuntAdapter(SourceAdapter):
         if topic:
             search_terms.append(topic)
         combined_topic = ", ".join(search_terms) if search_terms else ""
+        topic_re = _topic_pattern(combined_topic) if combined_topic else None
 
         posts: list[Post] = []
+        scanned = 0
 
-        for entry in entries:
-            title_el = entry.find(f"{{{ATOM_NS}}}title")
-            title = title_el.text.strip() if title_el is not None and title_el.text else ""
-
-            content_el = entry.find(f"{{{ATOM_NS}}}content")
-            content_html = content_el.text or "" if content_el is not None else ""
-            tagline = _extract_tagline(content_html)
-
-            # Filter by topic if provided
-            if combined_topic and not _topic_matches(title, tagline, combined_topic):
+        # Stream the feed: handle each <entry> as soon as it closes, then drop
+        # it, and stop reading once we have enough posts
+        for _, elem in iterparse(io.BytesIO(xml_bytes), events=("end",)):
+            if elem.tag != _ENTRY:
                 continue
-
-            # Parse date and check lookback window
-            published_el = entry.find(f"{{{ATOM_NS}}}published")
-            published_str = published_el.text if published_el is not None else ""
-            published = _parse_atom_date(published_str) if published_str else datetime.now(timezone.utc)
-
-            if published < cutoff:
+            scanned += 1
+            post = self._entry_to_post(elem, topic_re, cutoff)
+            elem.clear()
+            if post is None:
                 continue
 
-            # Extract URL
-            link_el = entry.find(f"{{{ATOM_NS}}}link")
-            url = link_el.get("href", "") if link_el is not None else ""
-
-            # Extract author
-            author_el = entry.find(f"{{{ATOM_NS}}}author/{{{ATOM_NS}}}name")
-            author = author_el.text.strip() if author_el is not None and author_el.text else ""
-
-            # Extract post ID
-            id_el = entry.find(f"{{{ATOM_NS}}}id")
-            entry_id = id_el.text if id_el is not None else ""
-            post_id = _extract_post_id(entry_id)
-
-            # Combine title + tagline for the text field
-            text = f"{title}\n\n{tagline}" if tagline else title
-
-            posts.append(Post(
-                source="producthunt",
-                author=author,
-                text=text,
-                url=url,
-                timestamp=published.isoformat(),
-                score=0,  # Atom feed doesn't include vote counts
-                metadata={
-                    "tagline": tagline,
-                    "post_id": post_id,
-                    "product_url": url,
-                },
-            ))
-
+            posts.append(post)
             if len(posts) >= max_results:
                 break
 
+        print(f"  [producthunt] {scanned} entries scanned", file=sys.stderr)
         print(f"  -> {len(posts)} products from Product Hunt", file=sys.stderr)
         return posts
+
+    @staticmethod
+    def _entry_to_post(entry: Element, topic_re: re.Pattern | None, cutoff: datetime) -> Post | None:
+        """Convert one Atom <entry> to a Post, or None if it's filtered out."""
+        # One pass over the children instead of a find() scan per field.
+        # setdefault keeps the first of repeated tags (e.g. <link>), like find().
+        fields: dict[str, Element] = {}
+        for child in entry:
+            fields.setdefault(child.tag, child)
+
+        # Cheapest filter first: entries outside the lookback window are
+        # dropped before any title/tagline work
+        published_el = fields.get(_PUBLISHED)
+        published_str = published_el.text if published_el is not None else ""
+        published = _parse_atom_date(published_str) if published_str else datetime.now(timezone.utc)
+
+        if published < cutoff:
+            return None
+
+        title_el = fields.get(_TITLE)
+        title = title_el.text.strip() if title_el is not None and title_el.text else ""
+
+        content_el = fields.get(_CONTENT)
+        content_html = content_el.text or "" if content_el is not None else ""
+        tagline = _extract_tagline(content_html)
+
+        # Filter by topic if provided
+        if topic_re and not topic_re.search(f"{title} {tagline}".lower()):
+            return None
+
+        # Extract URL
+        link_el = fields.get(_LINK)
+        url = link_el.get("href", "") if link_el is not None else ""
+
+        # Extract author
+        author_el = fields.get(_AUTHOR)
+        name_el = author_el.find(_NAME) if author_el is not None else None
+        author = name_el.text.strip() if name_el is not None and name_el.text else ""
+
+        # Extract post ID
+        id_el = fields.get(_ID)
+        entry_id = id_el.text if id_el is not None else ""
+        post_id = _extract_post_id(entry_id)
+
+        # Combine title + tagline for the text field
+        text = f"{title}\n\n{tagline}" if tagline else title
+
+        return Post(
+            source="producthunt",
+            author=author,
+            text=text,
+            url=url,
+            timestamp=published.isoformat(),
+            score=0,  # Atom feed doesn't include vote counts
+            metadata={
+                "tagline": tagline,
+                "post_id": post_id,
+                "product_url": url,
+            },
+        )
@@ -48,7 +48,7 @@ def _reddit_get(url: str) -> dict:
     req.add_header("User-Agent", USER_AGENT)
     try:
         with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+            return json.load(resp)
     except Exception as e:
         print(f"  ⚠ Reddit request failed: {e}", file=sys.stderr)
         return {}
@@ -1,20 +1,261 @@
 """X (Twitter) source adapter — uses the X API v2 recent search endpoint."""
 
+import hashlib
 import json
 import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import quote, urlencode
 
 from .base import Post, SourceAdapter
+from .net import http_request
 
 TWEET_FIELDS = "author_id,created_at,public_metrics,entities,referenced_tweets"
 USER_FIELDS = "username,name,verified,public_metrics"
 EXPANSIONS = "author_id"
 
+SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+TWEET_URL_TMPL = "https://x.com/%s/status/%s"
+
+# Search query string: the field/expansion params never change, so they are
+# encoded once and only query, max_results and start_time are filled per call
+_SEARCH_PARAM_TMPL = "query=%s&max_results=%d&start_time=%s&" + urlencode({
+    "tweet.fields": TWEET_FIELDS,
+    "user.fields": USER_FIELDS,
+    "expansions": EXPANSIONS,
+}).replace("%", "%%")
+
+# Queries run concurrently; recent search allows ~1 req/sec, so keep this low
+MAX_CONCURRENT_QUERIES = 4
+
+# X API v2 recent search: 60 requests / 15 min window
+RATE_LIMIT_REQUESTS = 60
+RATE_LIMIT_WINDOW = 15 * 60
+
+# On 429, wait out Retry-After / x-rate-limit-reset if it's short; otherwise
+# give up on that query rather than stalling the whole run
+MAX_RETRIES = 2
+MAX_RETRY_WAIT = 60.0
+_BACKOFF_BASE = 2.0
+
+# X API v2 recent search allows 512-char queries; leave headroom
+MAX_QUERY_LEN = 480
+
+# Trailing run of negated operators/phrases, e.g. ` -is:retweet -"dm me"`
+_NEG_TAIL_RE = re.compile(r'(?:\s+-(?:"[^"]*"|[^\s"()]+))+\s*$')
+_NEG_TOKEN_RE = re.compile(r'-(?:"[^"]*"|[^\s"()]+)')
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: ``capacity`` requests, refilled evenly over ``window`` seconds."""
+
+    def __init__(self, capacity: int, window: float):
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._rate = capacity / window
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+_bucket = _TokenBucket(RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW)
+
+
+def _retry_delay(err: HTTPError, attempt: int) -> float:
+    """Seconds to wait after a 429 — Retry-After, then x-rate-limit-reset, then backoff."""
+    headers = err.headers
+    retry_after = headers.get("Retry-After", "") if headers else ""
+    if retry_after.isdigit():
+        return float(retry_after)
+    reset = headers.get("x-rate-limit-reset", "") if headers else ""
+    if reset.isdigit():
+        return max(0.0, int(reset) - time.time())
+    return _BACKOFF_BASE * 2 ** attempt
+
+
+def _split_negations(query: str) -> tuple[str, tuple[str, ...]]:
+    """Split a query into (body, trailing negative filters)."""
+    match = _NEG_TAIL_RE.search(query)
+    if not match:
+        return query.strip(), ()
+    return query[:match.start()].strip(), tuple(_NEG_TOKEN_RE.findall(match.group()))
+
+
+def _is_grouped(body: str) -> bool:
+    """True if the whole body is a single parenthesized group, e.g. ``(a OR b)``."""
+    if not (body.startswith("(") and body.endswith(")")):
+        return False
+    depth = 0
+    in_quote = False
+    for i, ch in enumerate(body):
+        if ch == '"':
+            in_quote = not in_quote
+        elif not in_quote and ch == "(":
+            depth += 1
+        elif not in_quote and ch == ")":
+            depth -= 1
+            if depth == 0:
+                return i == len(body) - 1
+    return False
+
+
+def _is_or_chain(body: str) -> bool:
+    """True if the body is only terms OR'd together, with no AND-ed groups.
+
+    ``"a" OR "b"`` and ``("a" OR "b")`` qualify; ``("a" OR "b") ("x" OR "y")``
+    does not — its implicit AND narrows the terms.
+    """
+    if _is_grouped(body):
+        body = body[1:-1]
+    items: list[str] = []
+    item_start = None
+    depth = 0
+    in_quote = False
+    for i, ch in enumerate(body + " "):
+        if ch == '"':
+            in_quote = not in_quote
+        elif not in_quote and ch == "(":
+            depth += 1
+        elif not in_quote and ch == ")":
+            depth -= 1
+        if ch.isspace() and not in_quote and depth == 0:
+            if item_start is not None:
+                items.append(body[item_start:i])
+                item_start = None
+        elif item_start is None:
+            item_start = i
+    return len(items) % 2 == 1 and all(
+        (item == "OR") == (i % 2 == 1) for i, item in enumerate(items)
+    )
+
+
+def _pack_queries(queries: list[str], max_len: int = MAX_QUERY_LEN) -> list[tuple[str, int]]:
+    """Greedily merge queries into fewer API calls. Returns (query, n_merged) pairs.
+
+    Queries that end in the same negative filters are OR'd together with the
+    filters hoisted out so they appear once: ``((a) OR (b)) -x -y``. X applies
+    AND before OR, hence the outer parens. Queries with different filters are
+    never merged, so no fragment ends up filtered more narrowly than before.
+
+    Only plain OR chains are merged. A query that ANDs terms with something
+    else (signal words, ``from:`` handles) is usually a narrower tier of a
+    broader query — OR'd into it, it would match nothing the broad query
+    doesn't, and its results would be lost — so it always runs on its own.
+    """
+    # Each slot is a standalone query or a filter group, kept in the order
+    # its first query appears, so calls run in the caller's query order
+    slots: list[str | tuple[str, ...]] = []
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for query in queries:
+        body, negations = _split_negations(query)
+        if not _is_or_chain(body):
+            slots.append(query)
+            continue
+        if negations not in groups:
+            groups[negations] = []
+            slots.append(negations)
+        groups[negations].append(body)
+
+    def _render(bodies: list[str], negations: tuple[str, ...]) -> str:
+        if len(bodies) == 1:
+            joined = bodies[0]
+        else:
+            joined = "(" + " OR ".join(b if _is_grouped(b) else f"({b})" for b in bodies) + ")"
+        return f"{joined} {' '.join(negations)}" if negations else joined
+
+    packed: list[tuple[str, int]] = []
+    for slot in slots:
+        if isinstance(slot, str):
+            packed.append((slot, 1))
+            continue
+        negations, bodies = slot, groups[slot]
+        batch: list[str] = []
+        for body in bodies:
+            if batch and len(_render(batch + [body], negations)) > max_len:
+                packed.append((_render(batch, negations), len(batch)))
+                batch = []
+            batch.append(body)
+        if batch:
+            packed.append((_render(batch, negations), len(batch)))
+    return packed
+
+
+# Exchanged bearer tokens, keyed by (consumer_key, api_key) — at most one
+# OAuth2 round trip per credential pair per process
+_token_cache: dict[tuple[str, str], str] = {}
+
+# App-only bearer tokens don't expire until revoked; the on-disk copy is
+# re-exchanged daily anyway so a revoked token can't linger
+BEARER_CACHE_TTL = 24 * 60 * 60
+
+
+def _bearer_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "xscout" / "twitter_bearer.json"
+
+
+def _creds_fingerprint(consumer_key: str, api_key: str) -> str:
+    """Hash of the credential pair, so the cache file never stores the keys."""
+    return hashlib.sha256(f"{consumer_key}:{api_key}".encode()).hexdigest()
+
+
+def _load_cached_bearer(fingerprint: str) -> str:
+    """Return the on-disk token for these credentials if it is still fresh."""
+    try:
+        entry = json.loads(_bearer_cache_path().read_text())
+        if entry["creds"] != fingerprint or time.time() - entry["created_at"] >= BEARER_CACHE_TTL:
+            return ""
+        return entry["token"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return ""
+
+
+def _save_cached_bearer(fingerprint: str, token: str):
+    path = _bearer_cache_path()
+    entry = {"token": token, "created_at": time.time(), "creds": fingerprint}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            os.chmod(path, 0o600)  # O_CREAT's mode doesn't apply to an existing file
+            json.dump(entry, f)
+    except OSError as e:
+        print(f"    ⚠ Could not cache X bearer token: {e}", file=sys.stderr)
+
+
+def _forget_cached_bearer():
+    """Drop the exchanged token from memory and disk, e.g. after it's been revoked."""
+    _token_cache.clear()
+    try:
+        _bearer_cache_path().unlink(missing_ok=True)
+    except OSError as e:
+        print(f"    ⚠ Could not remove cached X bearer token: {e}", file=sys.stderr)
+
 
 def _get_bearer_token() -> str:
-    """Get bearer token from env. If only consumer/api keys are set, exchange them."""
+    """Get bearer token from env. If only consumer/api keys are set, exchange them.
+
+    Exchanged tokens are cached in memory and under ``$XDG_CACHE_HOME/xscout``
+    (default ``~/.cache/xscout``), so repeat CLI runs skip the OAuth2 call.
+    """
     token = os.environ.get("X_BEARER_TOKEN", "")
     if token:
         return token
@@ -24,16 +265,30 @@ def _get_bearer_token() -> str:
     if not consumer_key or not api_key:
         return ""
 
+    cache_key = (consumer_key, api_key)
+    if cache_key in _token_cache:
+        return _token_cache[cache_key]
+
+    fingerprint = _creds_fingerprint(consumer_key, api_key)
+    token = _load_cached_bearer(fingerprint)
+    if token:
+        _token_cache[cache_key] = token
+        return token
+
     import base64
     creds = base64.b64encode(f"{consumer_key}:{api_key}".encode()).decode()
-    req = Request("https://api.twitter.com/oauth2/token")
-    req.add_header("Authorization", f"Basic {creds}")
-    req.add_header("Content-Type", "application/x-www-form-urlencoded;charset=UTF-8")
+    headers = {
+        "Authorization": f"Basic {creds}",
+        "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+    }
     data = urlencode({"grant_type": "client_credentials"}).encode()
 
-    with urlopen(req, data) as resp:
-        result = json.loads(resp.read().decode())
-        return result.get("access_token", "")
+    result = json.loads(http_request("https://api.twitter.com/oauth2/token", data, headers, timeout=30))
+    token = result.get("access_token", "")
+    if token:
+        _token_cache[cache_key] = token
+        _save_cached_bearer(fingerprint, token)
+    return token
 
 
 class XAdapter(SourceAdapter):
@@ -50,41 +305,82 @@ class XAdapter(SourceAdapter):
         if not queries:
             from queries import build_topic_queries
             queries = build_topic_queries(topic)
+        queries = self._dedup_queries(queries)
 
+        # Computed once and shared by every query in this fetch
         start_time = (
             datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
-        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        ).isoformat(timespec="seconds").replace("+00:00", "Z")
 
         posts: list[Post] = []
         per_query = min(max_results, 100)
+        # Built once and shared by every search worker
+        headers = {"Authorization": f"Bearer {bearer_token}", "Accept-Encoding": "gzip"}
+
+        # Fewer, larger calls: a packed call pages through one page per
+        # query it replaces, so the merged fragments keep their result budget
+        packed = _pack_queries(queries)
 
-        import sys
-        for i, query in enumerate(queries, 1):
-            print(f"  [x {i}/{len(queries)}] {query[:60]}...", file=sys.stderr)
-            result = self._search(query, start_time, bearer_token, per_query)
-            posts.extend(self._normalize(result))
+        print(f"  [x] {len(queries)} queries packed into {len(packed)} calls", file=sys.stderr)
+        for i, (query, _) in enumerate(packed, 1):
+            print(f"  [x {i}/{len(packed)}] {query[:60]}...", file=sys.stderr)
+
+        # Capped by MAX_CONCURRENT_QUERIES for the rate limit; map() keeps query order
+        workers = min(MAX_CONCURRENT_QUERIES, len(packed))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                lambda qn: self._search_pages(qn[0], start_time, headers, per_query, pages=qn[1]),
+                packed,
+            )
+            for result in results:
+                posts.extend(self._normalize(result))
 
         print(f"  -> {len(posts)} posts from X", file=sys.stderr)
         return posts
 
-    def _search(self, query: str, start_time: str, bearer_token: str, max_results: int) -> dict:
-        params = urlencode({
-            "query": query,
-            "max_results": max_results,
-            "start_time": start_time,
-            "tweet.fields": TWEET_FIELDS,
-            "user.fields": USER_FIELDS,
-            "expansions": EXPANSIONS,
-        })
-        url = f"https://api.twitter.com/2/tweets/search/recent?{params}"
-        req = Request(url)
-        req.add_header("Authorization", f"Bearer {bearer_token}")
-
-        try:
-            with urlopen(req) as resp:
-                return json.loads(resp.read().decode())
-        except Exception as e:
-            return {"error": str(e), "query": query}
+    def _search_pages(self, query: str, start_time: str, headers: dict, max_results: int,
+                      pages: int = 1) -> dict:
+        """Run a search over up to ``pages`` pages, merging tweets and users into one result."""
+        result = self._search(query, start_time, headers, max_results)
+        next_token = result.get("meta", {}).get("next_token")
+        for _ in range(pages - 1):
+            if not next_token:
+                break
+            page = self._search(query, start_time, headers, max_results, next_token)
+            if "error" in page:
+                break
+            result.setdefault("data", []).extend(page.get("data", []))
+            users = page.get("includes", {}).get("users", [])
+            result.setdefault("includes", {}).setdefault("users", []).extend(users)
+            next_token = page.get("meta", {}).get("next_token")
+        return result
+
+    def _search(self, query: str, start_time: str, headers: dict, max_results: int,
+                next_token: str = "") -> dict:
+        params = _SEARCH_PARAM_TMPL % (quote(query, safe=""), max_results, quote(start_time, safe=""))
+        if next_token:
+            params += f"&next_token={quote(next_token, safe='')}"
+        url = f"{SEARCH_URL}?{params}"
+
+        for attempt in range(MAX_RETRIES + 1):
+            _bucket.acquire()
+            try:
+                return json.loads(http_request(url, headers=headers, timeout=30))
+            except HTTPError as e:
+                if e.code == 401:
+                    # Revoked or invalid token — don't keep reusing a cached copy
+                    _forget_cached_bearer()
+                    print(f"    ⚠ X API rejected the bearer token: {e}", file=sys.stderr)
+                    return {"error": str(e), "query": query}
+                if e.code != 429 or attempt == MAX_RETRIES:
+                    return {"error": str(e), "query": query}
+                delay = _retry_delay(e, attempt)
+                if delay > MAX_RETRY_WAIT:
+                    return {"error": f"rate limited, resets in {delay:.0f}s", "query": query}
+                print(f"    ⚠ X rate limited, retrying in {delay:.0f}s", file=sys.stderr)
+                time.sleep(delay)
+            except Exception as e:
+                return {"error": str(e), "query": query}
 
     def _normalize(self, result: dict) -> list[Post]:
         """Convert X API response into normalized Post objects."""
@@ -97,17 +393,19 @@ class XAdapter(SourceAdapter):
             author_id = tweet.get("author_id", "")
             username = author_map.get(author_id, "unknown")
             metrics = tweet.get("public_metrics", {})
+            likes = metrics.get("like_count", 0)
+            retweets = metrics.get("retweet_count", 0)
 
             posts.append(Post(
                 source="x",
                 author=f"@{username}",
                 text=tweet.get("text", ""),
-                url=f"https://x.com/{username}/status/{tweet_id}",
+                url=TWEET_URL_TMPL % (username, tweet_id),
                 timestamp=tweet.get("created_at", ""),
-                score=metrics.get("like_count", 0) + metrics.get("retweet_count", 0),
+                score=likes + retweets,
                 metadata={
-                    "likes": metrics.get("like_count", 0),
-                    "retweets": metrics.get("retweet_count", 0),
+                    "likes": likes,
+                    "retweets": retweets,
                     "replies": metrics.get("reply_count", 0),
                 },
             ))